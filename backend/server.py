@@ -7,20 +7,42 @@ representation suitable for downstream processing.
 '''
 
 from __future__ import annotations
+import asyncio
 from datetime import datetime, timezone
-import json
-from operator import attrgetter
+import os
 import signal
 import subprocess
+import time
 import typing
-from typing import Dict, List, Literal, Optional, TypedDict
+import zlib
+from typing import Dict, List, Literal, Optional, Tuple, TypedDict
 
 from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+import ijson
 from jinja2 import Environment, select_autoescape
+import numpy as np
+import orjson
 from pydantic import BaseModel
 
+try:
+    from . import taskwarrior_io
+except ImportError:
+    import taskwarrior_io
+
+
+class ORJSONResponse(JSONResponse):
+    '''
+    JSON response rendered with `orjson` instead of the stdlib `json`
+    module, which is considerably faster for both small and large
+    payloads.
+    '''
+
+    media_type = 'application/json'
+
+    def render(self, content: typing.Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC)
+
 
 DATETIME_FORMAT = '%Y%m%dT%H%M%SZ'
 '''Format for the datetime strings in the raw tasks.'''
@@ -74,6 +96,88 @@ class IncorrectDateFormatException(Exception):
         )
 
 
+_UTC = timezone.utc
+'''Module-level alias to avoid repeated attribute lookups in hot loops.'''
+
+
+def _parse_tw_dt(s: str) -> datetime:
+    '''
+    Parse a TaskWarrior datetime string in format `DATETIME_FORMAT`.
+
+    The format is a fixed-width 16-character ASCII string
+    (`YYYYMMDDTHHMMSSZ`), so the fields are decoded by slicing
+    rather than going through `datetime.strptime`, which is far
+    slower due to its format-parsing and locale machinery.
+
+    Args:
+        s: The datetime string to parse.
+
+    Returns:
+        The parsed datetime in UTC.
+
+    Raises:
+        IncorrectDateFormatException: If the string does not match
+            `DATETIME_FORMAT`.
+    '''
+
+    if len(s) != 16 or s[8] != 'T' or s[15] != 'Z':
+        raise IncorrectDateFormatException(s)
+
+    try:
+        return datetime(
+            int(s[0:4]),
+            int(s[4:6]),
+            int(s[6:8]),
+            int(s[9:11]),
+            int(s[11:13]),
+            int(s[13:15]),
+            tzinfo=_UTC,
+        )
+    except ValueError:
+        raise IncorrectDateFormatException(s)
+
+
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+'''Weekday names indexed by `datetime.weekday()`.'''
+
+_MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December',
+)
+'''Month names indexed by `datetime.month - 1`.'''
+
+
+def _format_due_display(due: datetime) -> str:
+    '''
+    Format a due datetime for display, e.g. `Monday, March 16, 2026 at 03:59 AM`.
+
+    Equivalent to `strftime('%A, %B %d, %Y at %I:%M %p')` but built
+    from precomputed name tables, skipping strftime's format parsing
+    and locale lookups. Computed once per task so the render loop
+    only interpolates a ready-made string.
+
+    Args:
+        due: The due datetime to format.
+
+    Returns:
+        The formatted string.
+    '''
+
+    hour12 = due.hour % 12 or 12
+    meridiem = 'AM' if due.hour < 12 else 'PM'
+    return (
+        f'{_WEEKDAY_NAMES[due.weekday()]}, {_MONTH_NAMES[due.month - 1]} '
+        f'{due.day:02d}, {due.year} at {hour12:02d}:{due.minute:02d} {meridiem}'
+    )
+
+
+SECONDS_PER_MINUTE = 60
+MINUTES_PER_HOUR   = 60
+HOURS_PER_DAY      = 24
+SECONDS_PER_HOUR   = SECONDS_PER_MINUTE * MINUTES_PER_HOUR
+SECONDS_PER_DAY    = SECONDS_PER_HOUR * HOURS_PER_DAY
+
+
 class TimeDiffModel(BaseModel):
     '''
     Representation of a difference between two datetimes.
@@ -82,11 +186,11 @@ class TimeDiffModel(BaseModel):
     `minutes` for easier consumption by clients.
     '''
 
-    SECONDS_PER_MINUTE : typing.ClassVar[int] = 60
-    MINUTES_PER_HOUR   : typing.ClassVar[int] = 60
-    HOURS_PER_DAY      : typing.ClassVar[int] = 24
-    SECONDS_PER_HOUR   : typing.ClassVar[int] = SECONDS_PER_MINUTE * MINUTES_PER_HOUR
-    SECONDS_PER_DAY    : typing.ClassVar[int] = SECONDS_PER_HOUR * HOURS_PER_DAY
+    SECONDS_PER_MINUTE : typing.ClassVar[int] = SECONDS_PER_MINUTE
+    MINUTES_PER_HOUR   : typing.ClassVar[int] = MINUTES_PER_HOUR
+    HOURS_PER_DAY      : typing.ClassVar[int] = HOURS_PER_DAY
+    SECONDS_PER_HOUR   : typing.ClassVar[int] = SECONDS_PER_HOUR
+    SECONDS_PER_DAY    : typing.ClassVar[int] = SECONDS_PER_DAY
 
     days    : int = 0
     hours   : int = 0
@@ -105,18 +209,15 @@ class TimeDiffModel(BaseModel):
             A `TimeDiff` mapping with keys `days`, `hours`, and `minutes`.
         '''
 
-        if dt1 > dt2:
-            delta = dt1 - dt2
-        else:
-            delta = dt2 - dt1
+        total_seconds = int(abs((dt1 - dt2).total_seconds()))
 
-        total_seconds = int(delta.total_seconds())
+        days      = total_seconds // SECONDS_PER_DAY
+        remainder = total_seconds - days * SECONDS_PER_DAY
+        hours     = remainder // SECONDS_PER_HOUR
+        minutes   = (remainder - hours * SECONDS_PER_HOUR) // SECONDS_PER_MINUTE
 
-        days, remainder  = divmod(total_seconds , TimeDiffModel.SECONDS_PER_DAY   )
-        hours, remainder = divmod(remainder     , TimeDiffModel.SECONDS_PER_HOUR  )
-        minutes, _       = divmod(remainder     , TimeDiffModel.SECONDS_PER_MINUTE)
-
-        return TimeDiffModel(
+        # Inputs are computed ints, so skip Pydantic validation.
+        return TimeDiffModel.model_construct(
             days    = days    ,
             hours   = hours   ,
             minutes = minutes ,
@@ -139,63 +240,79 @@ class TaskImprovedModel(BaseModel):
     priority    : Optional[Literal['HIGH', 'MEDIUM', 'LOW']] = None
     project     : Optional[str]                              = None
     due         : Optional[datetime]                         = None
+    due_display : Optional[str]                              = None
     due_in      : Optional[TimeDiffModel]                    = None
     overdue_by  : Optional[TimeDiffModel]                    = None
     urgency     : Optional[float]                            = 0.0
 
-    @staticmethod
-    def from_raw(raw_task: TaskRaw) -> TaskImprovedModel:
-        '''
-        Creates a task from a raw TaskWarrior task.
 
-        Args:
-            raw_task: The raw TaskWarrior task.
+def _generate_task_dumper():
+    '''
+    Generate a specialized `TaskImprovedModel -> dict` function.
 
-        Returns:
-            The improved task representation.
-        '''
+    Pydantic's `model_dump` walks the field set generically on every
+    call. The field set is fixed, so build the equivalent literal
+    dict expression from `model_fields` once at import time and
+    `exec` it into a plain function: each call is then straight-line
+    attribute access with no introspection. Nested `TimeDiffModel`
+    fields are inlined the same way.
 
-        description = raw_task.get('description') or ''
-        status = raw_task.get('status') or 'pending'
-        urgency = raw_task.get('urgency') or 0.0
-        project = raw_task.get('project')
-        priority = TaskImprovedModel.PRIORITY_MAP.get(raw_task.get('priority'))
+    Returns:
+        A function mapping a `TaskImprovedModel` to a dictionary
+        shaped like its `model_dump` output.
+    '''
 
-        due = None
-        due_in = None
-        overdue_by = None
+    lines = []
+    for name, field in TaskImprovedModel.model_fields.items():
+        annotation_args = typing.get_args(field.annotation)
+        if field.annotation is TimeDiffModel or TimeDiffModel in annotation_args:
+            expr = (
+                f"{{'days': t.{name}.days, 'hours': t.{name}.hours, "
+                f"'minutes': t.{name}.minutes}} if t.{name} is not None else None"
+            )
+        else:
+            expr = f't.{name}'
+        lines.append(f"        {name!r}: {expr},")
 
-        due_str = raw_task.get('due')
-        if due_str:
-            try:
-                due = datetime.strptime(due_str, DATETIME_FORMAT).replace(tzinfo=timezone.utc)
-            except ValueError:
-                raise IncorrectDateFormatException(due_str)
+    src = 'def _dump_task(t):\n    return {\n' + '\n'.join(lines) + '\n    }\n'
+    namespace = {}
+    exec(compile(src, '<task-dumper>', 'exec'), namespace)
+    return namespace['_dump_task']
 
-            now = datetime.now(timezone.utc)
-            time_diff = TimeDiffModel.diff(now, due)
-            if now > due:
-                overdue_by = time_diff
-            else:
-                due_in = time_diff
 
-        return TaskImprovedModel(
-            description = description ,
-            status      = status      ,
-            priority    = priority    ,
-            project     = project     ,
-            due         = due         ,
-            due_in      = due_in      ,
-            overdue_by  = overdue_by  ,
-            urgency     = urgency     ,
-        )
+_dump_task = _generate_task_dumper()
+'''Specialized dict serializer for `TaskImprovedModel`, generated at import time.'''
 
 
 CMD = ['task', 'status:pending', 'export']
 '''Command to export tasks as JSON.'''
 
+_SIG_NAMES = {int(s): s.name for s in signal.Signals}
+'''Signal numbers to names, precomputed so the crash error path is a
+dict lookup instead of enum construction.'''
+
+TASKS_CACHE_TTL_SECONDS = 1.0
+'''How long the output of `CMD` stays cached before the command is re-run.'''
+
+DIRECT_EXPORT = os.environ.get('TASKWARRIOR_DIRECT_EXPORT', '').lower() in ('1', 'true', 'yes')
+'''Whether to read `pending.data` directly instead of asking TaskWarrior.
+
+The direct reader is much faster than any export command, but its
+urgency values are an approximation (see `taskwarrior_io._urgency`)
+and can differ from TaskWarrior's for configurations with custom
+coefficients or task dependencies, so it must be opted into.'''
+
+_raw_tasks_cache: Optional[Tuple[float, int, List[TaskRaw]]] = None
+'''Cached `(timestamp, stdout hash, tasks)` from the last `CMD` invocation.'''
 
-def get_raw_tasks() -> List[TaskRaw]:
+_raw_tasks_cache_lock = asyncio.Lock()
+'''Guards `_raw_tasks_cache` so concurrent requests share one `CMD` run.'''
+
+_improved_tasks_cache: Optional[Tuple[float, int, List[TaskImprovedModel]]] = None
+'''Cached `(timestamp, stdout hash, improved tasks)` from the last `raw2improved` call.'''
+
+
+async def get_raw_tasks() -> List[TaskRaw]:
     '''
     Run the external TaskWarrior export command and parse its JSON.
 
@@ -204,47 +321,264 @@ def get_raw_tasks() -> List[TaskRaw]:
     `HTTPException` with status 502 if the command fails, crashes,
     or emits invalid JSON, or status 504 if the command times out.
 
+    When `DIRECT_EXPORT` is enabled and TaskWarrior's `pending.data`
+    file is readable, the tasks are parsed from it in-process via
+    `taskwarrior_io`, which is far cheaper than forking the export
+    command; the subprocess path is kept as a fallback. Results are
+    cached for `TASKS_CACHE_TTL_SECONDS` so that bursts of requests
+    collapse into a single read or subprocess invocation. The lock
+    is held for the duration of the refresh, so concurrent callers
+    wait for one run instead of forking their own.
+
     Returns:
         A list of `TaskRaw` dictionaries as returned by TaskWarrior.
     '''
 
+    global _raw_tasks_cache
+
+    async with _raw_tasks_cache_lock:
+        if _raw_tasks_cache is not None:
+            timestamp, _, tasks = _raw_tasks_cache
+            if time.monotonic() - timestamp < TASKS_CACHE_TTL_SECONDS:
+                return tasks
+
+        direct = None
+        if DIRECT_EXPORT:
+            try:
+                direct = taskwarrior_io.read_pending_tasks()
+            except (OSError, ValueError):
+                direct = None
+
+        if direct is not None:
+            tasks, mtime_ns = direct
+            tasks = typing.cast(List[TaskRaw], tasks)
+            _raw_tasks_cache = (time.monotonic(), mtime_ns, tasks)
+            return tasks
+
+        exported = await _export_via_worker()
+        if exported is None:
+            exported = await _run_export()
+        tasks, stdout_hash = exported
+        _raw_tasks_cache = (time.monotonic(), stdout_hash, tasks)
+        return tasks
+
+
+SHELL_CMD = ['task', 'rc.verbose=nothing', 'rc.confirmation=no', 'shell']
+'''Command starting a persistent TaskWarrior shell worker.'''
+
+_task_shell_proc: Optional[asyncio.subprocess.Process] = None
+'''The running shell worker, spawned lazily on first use.'''
+
+_task_shell_lock = asyncio.Lock()
+'''Serializes access to the shell worker's pipes.'''
+
+_task_shell_unavailable = False
+'''Set once the shell worker proves unusable, so requests skip straight to the one-shot export.'''
+
+
+async def _export_via_worker() -> Optional[Tuple[List[TaskRaw], int]]:
+    '''
+    Export pending tasks through a persistent `task shell` worker.
+
+    Spawns the worker on first use and keeps it alive across
+    requests, writing `status:pending export` to its stdin and
+    reading the JSON array back, which avoids a fork+exec of
+    TaskWarrior per request. The worker's stdout is line-oriented,
+    so the array is collected until its closing bracket.
+
+    Returns:
+        The parsed tasks and a checksum of the output, or `None` if
+        the worker is unavailable (e.g. this TaskWarrior build has
+        no `shell` command), in which case the caller should fall
+        back to the one-shot export.
+    '''
+
+    global _task_shell_proc, _task_shell_unavailable
+
+    if _task_shell_unavailable:
+        return None
+
+    async with _task_shell_lock:
+        proc = _task_shell_proc
+        if proc is None or proc.returncode is not None:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *SHELL_CMD,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except (FileNotFoundError, OSError):
+                _task_shell_unavailable = True
+                return None
+            _task_shell_proc = proc
+
+        try:
+            proc.stdin.write(b'status:pending export\n')
+            await proc.stdin.drain()
+            lines = await asyncio.wait_for(_read_export_array(proc), timeout=5)
+        except (asyncio.TimeoutError, OSError, EOFError):
+            proc.kill()
+            await proc.wait()
+            _task_shell_proc = None
+            _task_shell_unavailable = True
+            return None
+
+    stdout_bytes = b''.join(lines)
     try:
-        cp = subprocess.run(
-            CMD,
-            capture_output=True,
-            text=True,
-            timeout=5
+        tasks = orjson.loads(stdout_bytes)
+    except orjson.JSONDecodeError:
+        _task_shell_unavailable = True
+        return None
+
+    if not isinstance(tasks, list) or not all(isinstance(t, dict) for t in tasks):
+        _task_shell_unavailable = True
+        return None
+
+    return typing.cast(List[TaskRaw], tasks), zlib.crc32(stdout_bytes)
+
+
+async def _read_export_array(proc: asyncio.subprocess.Process) -> List[bytes]:
+    '''
+    Read one exported JSON array from the shell worker's stdout.
+
+    Args:
+        proc: The shell worker process.
+
+    Returns:
+        The lines of the array, including the brackets, with any
+        interactive `task>` prompts stripped.
+
+    Raises:
+        EOFError: If the worker closed its stdout mid-array.
+    '''
+
+    lines = []
+    while True:
+        line = await proc.stdout.readline()
+        if not line:
+            raise EOFError('worker closed stdout')
+        if line.startswith(b'task>'):
+            line = line[len(b'task>'):].lstrip()
+            if not line:
+                continue
+        lines.append(line)
+        stripped = line.strip()
+        if stripped in (b']', b'[]'):
+            return lines
+
+
+class _HashingStreamReader:
+    '''
+    Wraps an asyncio stream reader and checksums everything read.
+
+    Lets the streaming JSON parser consume subprocess stdout while
+    still producing a cache key for `raw2improved` without buffering
+    the whole output. Also remembers the first non-whitespace byte
+    of the stream so callers can tell whether the document root was
+    an array.
+    '''
+
+    def __init__(self, reader: asyncio.StreamReader):
+        self._reader = reader
+        self.checksum = 0
+        self.first_byte: Optional[int] = None
+
+    async def read(self, n: int = -1) -> bytes:
+        chunk = await self._reader.read(n)
+        self.checksum = zlib.crc32(chunk, self.checksum)
+        if self.first_byte is None:
+            stripped = chunk.lstrip()
+            if stripped:
+                self.first_byte = stripped[0]
+        return chunk
+
+
+async def _run_export() -> Tuple[List[TaskRaw], int]:
+    '''
+    Run `CMD` once and parse its JSON output.
+
+    The command runs as an asyncio subprocess and its stdout is fed
+    incrementally to a streaming JSON parser, so parsing overlaps
+    with TaskWarrior still writing its output instead of running as
+    a second serial phase after the process exits.
+
+    Returns:
+        The parsed list of raw tasks and a checksum of the command's
+        stdout, used as a cache key by `raw2improved`.
+    '''
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *CMD,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
-    except subprocess.TimeoutExpired:
-        raise HTTPException(status_code=504, detail='`task export` timed out')
     except FileNotFoundError as e:
         raise HTTPException(status_code=502, detail=f'File not found error: {e}')
     except OSError as e:
         raise HTTPException(status_code=502, detail=f'OS error: {e}')
 
-    rc = cp.returncode
+    stdout_reader = _HashingStreamReader(proc.stdout)
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+
+    async def consume() -> List[TaskRaw]:
+        tasks = []
+        # use_float keeps numbers as floats; ijson's default Decimal
+        # cannot be serialized by orjson.
+        async for task in ijson.items(stdout_reader, 'item', use_float=True):
+            tasks.append(task)
+        return tasks
+
+    try:
+        parse_error = None
+        try:
+            tasks = await asyncio.wait_for(consume(), timeout=5)
+        except ijson.JSONError:
+            # Decide between 'command failed' and 'invalid JSON' from
+            # the return code once the process has exited.
+            parse_error = True
+        await asyncio.wait_for(proc.wait(), timeout=5)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        stderr_task.cancel()
+        raise HTTPException(status_code=504, detail='`task export` timed out')
+
+    stderr_bytes = await stderr_task
+
+    rc = proc.returncode
 
     if rc < 0:
-        sig = signal.Signals(-rc).name
+        sig = _SIG_NAMES.get(-rc, str(-rc))
         raise HTTPException(status_code=502, detail=f'`task export` crashed: {sig}')
 
     if rc != 0:
-        err = (cp.stderr or '').strip()
+        err = stderr_bytes.decode('utf-8', 'replace').strip()
         raise HTTPException(status_code=502, detail=f'`task export` failed rc={rc}: {err}')
 
-    try:
-        tasks = json.loads(cp.stdout)
-        if not isinstance(tasks, list) or not all(isinstance(t, dict) for t in tasks):
-            raise HTTPException(status_code=502, detail='`task export` produced unexpected JSON shape')
-        return typing.cast(List[TaskRaw], tasks)
-    except json.JSONDecodeError:
+    if parse_error is not None:
         raise HTTPException(status_code=502, detail='`task export` generated invalid JSON')
 
+    # `items(..., 'item')` silently yields nothing for a non-array
+    # document, so check the root byte explicitly.
+    if stdout_reader.first_byte != ord('[') or not all(isinstance(t, dict) for t in tasks):
+        raise HTTPException(status_code=502, detail='`task export` produced unexpected JSON shape')
+
+    return typing.cast(List[TaskRaw], tasks), stdout_reader.checksum
+
 
 def raw2improved(raw_tasks: List[TaskRaw]) -> List[TaskImprovedModel]:
     '''
     Converts raw tasks to improved tasks.
 
+    The result is memoized against the stdout hash of the cached
+    `get_raw_tasks` output and bounded by `TASKS_CACHE_TTL_SECONDS`,
+    so the JSON and HTML endpoints share one conversion within a
+    burst while the time-relative `due_in`/`overdue_by` fields are
+    still recomputed once the TTL lapses, even if the underlying
+    task data has not changed.
+
     Args:
         raw_tasks: The list of raw tasks, which should come from the
             `get_raw_tasks` function.
@@ -252,7 +586,117 @@ def raw2improved(raw_tasks: List[TaskRaw]) -> List[TaskImprovedModel]:
     Returns:
         Improved tasks in the same order as in the `raw_tasks` list.
     '''
-    return [TaskImprovedModel.from_raw(raw_task) for raw_task in raw_tasks]
+
+    global _improved_tasks_cache
+
+    # Runs on the event loop with no awaits, so plain reads of the
+    # caches are safe without taking the asyncio lock.
+    cache_key = None
+    if _raw_tasks_cache is not None and _raw_tasks_cache[2] is raw_tasks:
+        cache_key = _raw_tasks_cache[1]
+
+    if cache_key is not None and _improved_tasks_cache is not None:
+        timestamp, cached_key, improved_tasks = _improved_tasks_cache
+        if cached_key == cache_key and time.monotonic() - timestamp < TASKS_CACHE_TTL_SECONDS:
+            return improved_tasks
+
+    now = datetime.now(timezone.utc)
+    now_s = int(now.timestamp())
+
+    # Bind everything the per-task loops touch as locals, turning
+    # repeated LOAD_GLOBAL/LOAD_ATTR bytecodes into LOAD_FAST.
+    parse_dt       = _parse_tw_dt
+    format_due     = _format_due_display
+    priority_get   = TaskImprovedModel.PRIORITY_MAP.get
+    construct_task = TaskImprovedModel.model_construct
+    construct_diff = TimeDiffModel.model_construct
+
+    # First pass: parse the string fields in Python and gather the
+    # due datetimes as epoch seconds (structure-of-arrays) for the
+    # vectorized diff computation.
+    dues: List[Optional[datetime]] = []
+    due_seconds: List[int] = []
+    append_due = dues.append
+    for raw_task in raw_tasks:
+        due_str = raw_task.get('due')
+        if due_str:
+            due = parse_dt(due_str)
+            due_seconds.append(int(due.timestamp()))
+        else:
+            due = None
+        append_due(due)
+
+    if due_seconds:
+        days, hours, minutes, overdue = _compute_time_diffs(
+            now_s,
+            np.asarray(due_seconds, dtype=np.int64),
+        )
+
+    # Second pass: build the models, consuming the diff arrays in
+    # order for the tasks that have a due date.
+    improved_tasks = []
+    append_task = improved_tasks.append
+    diff_index = 0
+    for raw_task, due in zip(raw_tasks, dues):
+        due_display = None
+        due_in = None
+        overdue_by = None
+        if due is not None:
+            due_display = format_due(due)
+            time_diff = construct_diff(
+                days    = int(days[diff_index])    ,
+                hours   = int(hours[diff_index])   ,
+                minutes = int(minutes[diff_index]) ,
+            )
+            if overdue[diff_index]:
+                overdue_by = time_diff
+            else:
+                due_in = time_diff
+            diff_index += 1
+
+        append_task(construct_task(
+            description = raw_task.get('description') or ''    ,
+            status      = raw_task.get('status') or 'pending'  ,
+            priority    = priority_get(raw_task.get('priority')),
+            project     = raw_task.get('project')              ,
+            due         = due                                  ,
+            due_display = due_display                          ,
+            due_in      = due_in                               ,
+            overdue_by  = overdue_by                           ,
+            urgency     = raw_task.get('urgency') or 0.0       ,
+        ))
+
+    if cache_key is not None:
+        _improved_tasks_cache = (time.monotonic(), cache_key, improved_tasks)
+    return improved_tasks
+
+
+def _compute_time_diffs(
+    now_s: int,
+    due_s: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    '''
+    Compute day/hour/minute diffs between `now_s` and each due time.
+
+    Operates on int64 epoch-second arrays so the arithmetic for the
+    whole batch runs in C instead of the Python interpreter.
+
+    Args:
+        now_s: Current time as epoch seconds.
+        due_s: Due times as an int64 array of epoch seconds.
+
+    Returns:
+        `(days, hours, minutes, overdue)` arrays, where `overdue` is
+        a boolean mask of tasks whose due time is in the past.
+    '''
+
+    delta = np.abs(now_s - due_s)
+    days = delta // SECONDS_PER_DAY
+    remainder = delta - days * SECONDS_PER_DAY
+    hours = remainder // SECONDS_PER_HOUR
+    minutes = (remainder - hours * SECONDS_PER_HOUR) // SECONDS_PER_MINUTE
+    overdue = due_s < now_s
+    return days, hours, minutes, overdue
 
 
 GPT_TASK_HTML_TEMPLATE = '''
@@ -271,18 +715,18 @@ GPT_TASK_HTML_TEMPLATE = '''
             <li><strong>Project:</strong> {{ task.project }}</li>
           {% endif %}
           {% if task.due %}
-            <li><strong>Due:</strong> {{ task.due.strftime("%A, %B %d, %Y at %I:%M %p") }}</li>
+            <li><strong>Due:</strong> {{ task.due_display }}</li>
           {% endif %}
           {% if task.due_in %}
             <li>
               <strong>Due in:</strong>
-              {{ task.due_in['days'] }} days, {{ task.due_in['hours'] }} hours, {{ task.due_in['days'] }} minutes
+              {{ task.due_in.days }} days, {{ task.due_in.hours }} hours, {{ task.due_in.minutes }} minutes
             </li>
           {% endif %}
           {% if task.overdue_by %}
             <li>
               <strong>Overdue by:</strong>
-              {{ task.overdue_by['days'] }} days, {{ task.overdue_by['hours'] }} hours, {{ task.overdue_by['days'] }} minutes
+              {{ task.overdue_by.days }} days, {{ task.overdue_by.hours }} hours, {{ task.overdue_by.minutes }} minutes
             </li>
           {% endif %}
           {% if task.urgency %}
@@ -296,23 +740,75 @@ GPT_TASK_HTML_TEMPLATE = '''
 </html>
 '''
 
-jinja_env = Environment(autoescape=select_autoescape())
+jinja_env = Environment(
+    autoescape=select_autoescape(),
+    auto_reload=False,
+    optimized=True,
+    cache_size=50,
+)
 gpt_task_html_template = jinja_env.from_string(GPT_TASK_HTML_TEMPLATE)
 
 
-app = FastAPI()
+class SimpleCORSMiddleware:
+    '''
+    Minimal ASGI middleware allowing any origin.
+
+    The endpoints only serve simple GET requests, so Starlette's
+    generic CORSMiddleware (origin regex matching, header and method
+    parsing on every request) is overkill. This just appends a fixed
+    `Access-Control-Allow-Origin: *` header to responses and
+    short-circuits `OPTIONS` preflights.
+    '''
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        if scope['method'] == 'OPTIONS':
+            await send({
+                'type': 'http.response.start',
+                'status': 204,
+                'headers': [
+                    (b'access-control-allow-origin', b'*'),
+                    (b'access-control-allow-methods', b'GET, OPTIONS'),
+                    (b'access-control-allow-headers', b'*'),
+                ],
+            })
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        async def send_with_cors(message):
+            if message['type'] == 'http.response.start':
+                message['headers'].append((b'access-control-allow-origin', b'*'))
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+app.add_middleware(SimpleCORSMiddleware)
+
+
+@app.on_event('shutdown')
+async def _stop_task_shell():
+    '''
+    Terminate the persistent shell worker, if one was started.
+    '''
+
+    global _task_shell_proc
+    if _task_shell_proc is not None and _task_shell_proc.returncode is None:
+        _task_shell_proc.kill()
+        await _task_shell_proc.wait()
+    _task_shell_proc = None
 
 
 @app.get('/tasks')
-def tasks():
+async def tasks():
     '''
     HTTP GET handler returning raw TaskWarrior tasks.
 
@@ -320,46 +816,78 @@ def tasks():
     of raw task objects.
     '''
 
-    return JSONResponse(content=get_raw_tasks())
+    return ORJSONResponse(content=await get_raw_tasks())
 
 
-@app.get('/gpt/tasks', response_model=List[TaskImprovedModel])
-def gpt_tasks():
+@app.get('/gpt/tasks', response_model=None)
+async def gpt_tasks():
     '''
     HTTP GET handler returning enhanced tasks for GPT processing in JSON format.
 
-    Transforms raw TaskWarrior tasks via `Task.from_raw` into a
+    Transforms raw TaskWarrior tasks via `raw2improved` into a
     normalized structure (ISO datetimes, priority strings, and
-    `due_in`/`overdue_by` diffs) and returns them as JSON.
+    `due_in`/`overdue_by` diffs) and returns them as JSON. The tasks
+    are serialized directly with orjson rather than going through
+    FastAPI's response-model validation, which would re-validate
+    every field per task.
     '''
 
-    raw_tasks = get_raw_tasks()
+    raw_tasks = await get_raw_tasks()
     try:
-        return raw2improved(raw_tasks)
+        improved_tasks = raw2improved(raw_tasks)
     except IncorrectDateFormatException as e:
         raise HTTPException(status_code=502, detail=str(e))
 
+    return ORJSONResponse(content=[_dump_task(task) for task in improved_tasks])
+
 
 @app.get('/gpt/html/tasks', response_class=HTMLResponse)
-def gpt_tasks_html():
+async def gpt_tasks_html():
     '''
     HTTP GET handler returning enhanced tasks for GPT processing in HTML format.
 
-    Transforms raw TaskWarrior tasks via `Task.from_raw` into a
+    Transforms raw TaskWarrior tasks via `raw2improved` into a
     normalized structure (ISO datetimes, priority strings, and
-    `due_in`/`overdue_by` diffs) and returns them as HTML.
+    `due_in`/`overdue_by` diffs) and returns them as HTML. The
+    template is rendered with `generate`, which yields the page in
+    chunks, so the response streams instead of materializing the
+    full HTML string in memory first.
     '''
-    raw_tasks = get_raw_tasks()
+    raw_tasks = await get_raw_tasks()
     try:
-        improved_tasks = sorted(
-            raw2improved(raw_tasks),
-            key=attrgetter('urgency'),
-            reverse=True
+        improved_tasks = raw2improved(raw_tasks)
+        # Sort by descending urgency via numpy argsort over a float32
+        # array, keeping the comparator out of the Python interpreter.
+        urgencies = np.fromiter(
+            (task.urgency or 0.0 for task in improved_tasks),
+            dtype=np.float32,
+            count=len(improved_tasks),
         )
-        html = gpt_task_html_template.render(
-            tasks=improved_tasks,
-            now=datetime.now()
+        order = np.argsort(-urgencies, kind='stable')
+        improved_tasks = [improved_tasks[i] for i in order.tolist()]
+        return StreamingResponse(
+            gpt_task_html_template.generate(
+                tasks=improved_tasks,
+                now=datetime.now()
+            ),
+            media_type='text/html'
         )
-        return HTMLResponse(content=html)
     except IncorrectDateFormatException as e:
         raise HTTPException(status_code=502, detail=str(e))
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    # uvloop and httptools (pulled in by uvicorn[standard]) replace
+    # the default event loop and HTTP parser with C implementations,
+    # which matters now that the endpoints are async and per-request
+    # overhead is mostly loop and parser work.
+    uvicorn.run(
+        'backend.server:app',
+        host='0.0.0.0',
+        port=8000,
+        loop='uvloop',
+        http='httptools',
+        workers=os.cpu_count(),
+    )
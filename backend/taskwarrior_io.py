@@ -0,0 +1,275 @@
+'''
+Direct reader for TaskWarrior's on-disk pending tasks.
+
+Forking `task status:pending export` makes TaskWarrior reparse its
+database and re-serialize it to JSON on every request. For the common
+case the same information can be read straight out of
+`~/.task/pending.data`, which this module parses in-process. The
+parsed result is cached against the file's `st_mtime_ns`, so an
+unchanged file costs a single `stat` call.
+
+The urgency values produced here are a close approximation of
+TaskWarrior's (see `_urgency`), not a bit-exact reproduction, so the
+server only uses this reader when it is explicitly enabled via the
+`TASKWARRIOR_DIRECT_EXPORT` environment variable, and falls back to
+the subprocess export path whenever the data file is absent or cannot
+be parsed.
+'''
+
+from __future__ import annotations
+import mmap
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DATETIME_FORMAT = '%Y%m%dT%H%M%SZ'
+'''Format for datetime strings in exported tasks (mirrors `server.DATETIME_FORMAT`).'''
+
+DATE_FIELDS = frozenset({'due', 'entry', 'modified', 'end', 'start', 'scheduled', 'until', 'wait'})
+'''Task fields stored as epoch seconds in the data file but exported as datetime strings.'''
+
+_FIELD_RE = re.compile(rb'(\w+):"((?:[^"\\]|\\.)*)"')
+'''Matches one `key:"value"` pair in a data file line. Operates on
+bytes so lines are only UTF-8 decoded value by value, as needed.'''
+
+_VALUE_DECODE = ((b'&open;', b'['), (b'&close;', b']'), (b'&dquot;', b'"'), (b'\\"', b'"'), (b'\\\\', b'\\'))
+'''Entity and escape sequences TaskWarrior uses inside quoted values.'''
+
+URGENCY_PRIORITY_COEFFICIENTS = {'H': 6.0, 'M': 3.9, 'L': 1.8}
+URGENCY_PROJECT_COEFFICIENT = 1.0
+URGENCY_TAGS_COEFFICIENT = 1.0
+URGENCY_ANNOTATIONS_COEFFICIENT = 1.0
+URGENCY_DUE_COEFFICIENT = 12.0
+URGENCY_AGE_COEFFICIENT = 2.0
+URGENCY_AGE_MAX_DAYS = 365.0
+URGENCY_ACTIVE_COEFFICIENT = 4.0
+URGENCY_SCHEDULED_COEFFICIENT = 5.0
+URGENCY_NEXT_TAG_COEFFICIENT = 15.0
+
+SECONDS_PER_DAY = 86400
+
+
+_pending_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+'''Cached `(st_mtime_ns, tasks)` from the last successful read.'''
+
+
+def data_location() -> str:
+    '''
+    Directory containing TaskWarrior's data files.
+
+    Honors the standard `TASKDATA` environment variable and defaults
+    to `~/.task`, matching this project's deployment layout.
+
+    Returns:
+        The expanded path of the data directory.
+    '''
+
+    return os.path.expanduser(os.environ.get('TASKDATA', '~/.task'))
+
+
+def read_pending_tasks() -> Optional[Tuple[List[Dict[str, Any]], int]]:
+    '''
+    Read and parse `pending.data`, reusing the mtime-keyed cache.
+
+    Returns:
+        `(tasks, st_mtime_ns)` where `tasks` matches the shape of
+        `task export` output, or `None` if the data file does not
+        exist.
+
+    Raises:
+        OSError: If the file exists but cannot be read.
+        ValueError: If a line in the file cannot be parsed.
+    '''
+
+    global _pending_cache
+
+    path = os.path.join(data_location(), 'pending.data')
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if _pending_cache is not None and _pending_cache[0] == mtime_ns:
+        return _pending_cache[1], mtime_ns
+
+    tasks = _parse_pending_file(path)
+    _pending_cache = (mtime_ns, tasks)
+    return tasks, mtime_ns
+
+
+def _parse_pending_file(path: str) -> List[Dict[str, Any]]:
+    '''
+    Parse every task line of a TaskWarrior data file.
+
+    The file holds one task per line as `[key:"value" key:"value" ...]`
+    with datetimes stored as epoch seconds. The file is mapped into
+    memory and scanned with a compiled regex rather than read through
+    buffered line I/O.
+
+    Args:
+        path: Path of the data file to parse.
+
+    Returns:
+        Raw tasks in file order, in the same shape as
+        `task status:pending export` output (datetime strings in
+        `DATETIME_FORMAT`, numeric `urgency`, 1-based `id`).
+    '''
+
+    tasks: List[Dict[str, Any]] = []
+    now_s = time.time()
+
+    with open(path, 'rb') as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped.
+            return tasks
+
+    with buf:
+        for task_id, line in enumerate(iter(buf.readline, b''), start=1):
+            line = line.strip()
+            if not line:
+                continue
+            if not (line.startswith(b'[') and line.endswith(b']')):
+                raise ValueError(f'Unparseable line {task_id} in {path}')
+            # pending.data also holds waiting tasks and recurring
+            # parent templates; the export command filters those out,
+            # so skip them here too. Quotes inside values are entity
+            # encoded, so this byte sequence only matches the status
+            # field itself. The line still counts toward the 1-based
+            # ids TaskWarrior assigns per data file line.
+            if b'status:"pending"' not in line:
+                continue
+            tasks.append(_parse_task_line(line, task_id, now_s))
+
+    return tasks
+
+
+def _parse_task_line(line: bytes, task_id: int, now_s: float) -> Dict[str, Any]:
+    '''
+    Parse one `[key:"value" ...]` line into an export-shaped task.
+
+    The line stays as bytes throughout; only the field values that
+    end up in the task dictionary are UTF-8 decoded.
+
+    Args:
+        line: The raw data file line.
+        task_id: 1-based position of the task in the file, exposed as
+            the task's `id` like TaskWarrior does for pending tasks.
+        now_s: Current epoch seconds, used for the urgency estimate.
+
+    Returns:
+        The task as a dictionary matching `task export` output.
+    '''
+
+    task: Dict[str, Any] = {'id': task_id}
+    annotations: List[Dict[str, str]] = []
+
+    for raw_key, value in _FIELD_RE.findall(line):
+        for encoded, decoded in _VALUE_DECODE:
+            if encoded in value:
+                value = value.replace(encoded, decoded)
+        key = raw_key.decode('ascii')
+        if key in DATE_FIELDS:
+            epoch = int(value)
+            task[key] = time.strftime(DATETIME_FORMAT, time.gmtime(epoch))
+            task[f'_{key}_s'] = epoch
+        elif key == 'tags':
+            task[key] = value.decode('utf-8').split(',')
+        elif key.startswith('annotation_'):
+            annotations.append({
+                'entry': time.strftime(DATETIME_FORMAT, time.gmtime(int(key[len('annotation_'):]))),
+                'description': value.decode('utf-8'),
+            })
+        else:
+            task[key] = value.decode('utf-8')
+
+    if annotations:
+        annotations.sort(key=lambda a: a['entry'])
+        task['annotations'] = annotations
+
+    task['urgency'] = _urgency(task, len(annotations), now_s)
+
+    for key in DATE_FIELDS:
+        task.pop(f'_{key}_s', None)
+
+    return task
+
+
+def _count_factor(count: int) -> float:
+    '''
+    TaskWarrior's scaling for countable urgency components: one item
+    contributes 0.8 of the coefficient, two contribute 0.9, and
+    three or more the full coefficient.
+
+    Args:
+        count: Number of items (tags or annotations).
+
+    Returns:
+        The scaling factor in `{0.0, 0.8, 0.9, 1.0}`.
+    '''
+
+    if count >= 3:
+        return 1.0
+    return (0.0, 0.8, 0.9)[count]
+
+
+def _urgency(task: Dict[str, Any], annotations: int, now_s: float) -> float:
+    '''
+    Estimate TaskWarrior's urgency for a task.
+
+    Implements the default coefficients for the priority, project,
+    tags, annotations, `next` tag, active (started), scheduled,
+    due-date proximity, and age components of TaskWarrior's urgency
+    formula. User-configured coefficients, UDAs, and the
+    dependency-based blocked/blocking components are not reproduced,
+    which is why the direct reader is opt-in rather than the
+    default export path.
+
+    Args:
+        task: The partially parsed task, including `_<field>_s` epoch
+            values for its date fields.
+        annotations: Number of annotations on the task.
+        now_s: Current epoch seconds.
+
+    Returns:
+        The estimated urgency.
+    '''
+
+    urgency = URGENCY_PRIORITY_COEFFICIENTS.get(task.get('priority'), 0.0)
+
+    if task.get('project'):
+        urgency += URGENCY_PROJECT_COEFFICIENT
+
+    tags = task.get('tags') or []
+    urgency += URGENCY_TAGS_COEFFICIENT * _count_factor(len(tags))
+    urgency += URGENCY_ANNOTATIONS_COEFFICIENT * _count_factor(annotations)
+    if 'next' in tags:
+        urgency += URGENCY_NEXT_TAG_COEFFICIENT
+
+    if task.get('_start_s') is not None:
+        urgency += URGENCY_ACTIVE_COEFFICIENT
+
+    scheduled_s = task.get('_scheduled_s')
+    if scheduled_s is not None and scheduled_s <= now_s:
+        urgency += URGENCY_SCHEDULED_COEFFICIENT
+
+    due_s = task.get('_due_s')
+    if due_s is not None:
+        days_overdue = (now_s - due_s) / SECONDS_PER_DAY
+        if days_overdue >= 7.0:
+            due_factor = 1.0
+        elif days_overdue >= -14.0:
+            due_factor = ((days_overdue + 14.0) * 0.8 / 21.0) + 0.2
+        else:
+            due_factor = 0.2
+        urgency += URGENCY_DUE_COEFFICIENT * due_factor
+
+    entry_s = task.get('_entry_s')
+    if entry_s is not None:
+        age_days = (now_s - entry_s) / SECONDS_PER_DAY
+        urgency += URGENCY_AGE_COEFFICIENT * min(age_days / URGENCY_AGE_MAX_DAYS, 1.0)
+
+    return round(urgency, 5)